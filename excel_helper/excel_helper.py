@@ -1,20 +1,90 @@
 import contextlib
-from typing import Any, Dict, List, Literal, Optional, Tuple, TypedDict, Union
-
+import itertools
+import os
+import re
+import secrets
+import shutil
+import sys
+import warnings
+import weakref
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    TypedDict,
+    Union,
+)
+
+import numpy as np
 import openpyxl
 import openpyxl.utils
 import openpyxl.utils.exceptions
 import pandas as pd
-from jinja2 import Template
+from jinja2 import Environment, Template
 from openpyxl.chart import BarChart, Reference
 from openpyxl.formatting.rule import ColorScaleRule
 from openpyxl.formula.translate import Translator
-from openpyxl.utils import get_column_letter
+from openpyxl.styles import NamedStyle
+from openpyxl.utils import get_column_letter, range_boundaries
+from openpyxl.utils.dataframe import dataframe_to_rows
 from openpyxl.workbook.workbook import Workbook
 from openpyxl.worksheet.datavalidation import DataValidation
 from openpyxl.worksheet.table import Table
 from openpyxl.worksheet.worksheet import Worksheet
 
+_IS_WINDOWS = sys.platform == "win32"
+
+# openpyxl serializes XML with lxml when it is installed and falls back to
+# the much slower standard library writer otherwise.
+_HAS_LXML = openpyxl.LXML
+
+_TEMPLATE_ENV = Environment(auto_reload=False)
+_PLACEHOLDER_RE = re.compile(r"\{\{.*?\}\}", re.S)
+
+
+def _cell_ref(row: int, col: int) -> str:
+    """Return an A1-style reference for a cell."""
+    return f"{get_column_letter(col)}{row}"
+
+
+def _range_ref(start_row: int, start_col: int, end_row: int, end_col: int) -> str:
+    """Return an A1:B2-style reference for a range of cells."""
+    start = get_column_letter(start_col)
+    end = get_column_letter(end_col)
+    return f"{start}{start_row}:{end}{end_row}"
+
+
+def _as_row(row_data: Iterable[Any]) -> Union[List[Any], Tuple[Any, ...]]:
+    """Return row_data as a list or tuple, the types Worksheet.append accepts."""
+    return row_data if isinstance(row_data, (list, tuple)) else list(row_data)
+
+
+def _create_temp_file(directory: str, suffix: str) -> Tuple[int, str]:
+    """
+    Create a new, uniquely named file in directory and return (fd, path).
+
+    Unlike tempfile.mkstemp, the file is created with mode 0o666 so the
+    kernel applies the process umask, as for any regular new file.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    while True:
+        path = os.path.join(directory, f"tmp{secrets.token_hex(8)}{suffix}")
+        try:
+            return os.open(path, flags, 0o666), path
+        except FileExistsError:
+            continue
+
+
+def _quit_excel(excel: Any) -> None:
+    """Quit an Excel application started through COM, ignoring errors."""
+    with contextlib.suppress(Exception):
+        excel.Quit()
+
 
 class ColorScaleKwargs(TypedDict, total=False):
     start_color: str
@@ -24,24 +94,112 @@ class ColorScaleKwargs(TypedDict, total=False):
 
 
 class ExcelHelper:
-    def __init__(self, filename: str):
+    def __init__(self, filename: str, mode: Literal["r", "rw", "w"] = "rw"):
+        if mode not in ("r", "rw", "w"):
+            raise ValueError(f"Unsupported mode: {mode}")
         self.filename = filename
+        self.mode = mode
         self.workbook = None
         self.active_sheet = None
+        self._next_append_row: Dict[str, int] = {}
+        self._bulk_styles: Dict[Tuple[Tuple[str, Any], ...], NamedStyle] = {}
+        self._excel: Any = None
+        self._excel_finalizer: Optional[weakref.finalize] = None
+
+    def __enter__(self) -> "ExcelHelper":
+        """Use the helper as a context manager that calls close_workbook on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the workbook and quit Excel if run_macro started it."""
+        self.close_workbook()
 
     def open_workbook(self):
-        """Open the Excel workbook."""
-        self.workbook = openpyxl.load_workbook(self.filename)
+        """
+        Open the Excel workbook.
+
+        In "r" mode the workbook is loaded with openpyxl's read_only=True and
+        data_only=True, which streams cells from the file instead of building
+        the whole sheet in memory. Methods that modify cells are disabled.
+        """
+        if self.mode == "w":
+            raise ValueError(
+                "Cannot open a workbook in 'w' mode, use create_new_workbook instead."
+            )
+        read_only = self.mode == "r"
+        self.workbook = openpyxl.load_workbook(
+            self.filename, read_only=read_only, data_only=read_only
+        )
         self.active_sheet = self.workbook.active
+        self._bulk_styles = {}
+
+    def close_workbook(self):
+        """
+        Close the Excel workbook, releasing the file handle held in read-only
+        mode and quitting the Excel application started by run_macro.
+        """
+        if self.workbook is not None:
+            self.workbook.close()
+        self._quit_excel_application()
 
     def save_workbook(self):
-        """Save the Excel workbook."""
-        self.workbook.save(self.filename)
+        """
+        Save the Excel workbook.
 
-    def create_new_workbook(self):
-        """Create a new Excel workbook."""
-        self.workbook = openpyxl.Workbook()
-        self.active_sheet = self.workbook.active
+        The workbook is written to a temporary file next to the target and
+        then moved into place, so a failed save never leaves a truncated file.
+        """
+        self._check_writable()
+        # Resolve symlinks so the file they point to is replaced, not the link.
+        target = os.path.realpath(self.filename)
+        fd, tmp_name = _create_temp_file(os.path.dirname(target), ".xlsx")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                self.workbook.save(tmp)
+            if os.path.exists(target):
+                shutil.copymode(target, tmp_name)
+            os.replace(tmp_name, target)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_name)
+            raise
+
+    def _check_writable(self):
+        """Raise if the workbook was opened read-only."""
+        if self.workbook is not None and self.workbook.read_only:
+            raise ValueError("Workbook is opened in read-only mode.")
+
+    def _check_cell_access(self):
+        """Raise if individual cells of the workbook cannot be written."""
+        self._check_writable()
+        if self.workbook.write_only:
+            raise ValueError(
+                "Cannot write individual cells in write-only mode, use write_range instead."
+            )
+
+    def create_new_workbook(self, write_only: bool = False):
+        """
+        Create a new Excel workbook.
+
+        With write_only=True the workbook streams rows straight to the file
+        instead of keeping every cell in memory until save. Only write_range
+        and from_dataframe are supported, rows must be written top to bottom,
+        and the workbook can only be saved once.
+        """
+        if write_only and not _HAS_LXML:
+            warnings.warn(
+                "lxml is not installed, write-only workbooks will be saved with the "
+                "slower standard library XML writer. "
+                "Install it with 'pip install excel-helper[fast]'.",
+                stacklevel=2,
+            )
+        self.workbook = openpyxl.Workbook(write_only=write_only)
+        if write_only:
+            self.active_sheet = self.workbook.create_sheet()
+        else:
+            self.active_sheet = self.workbook.active
+        self._next_append_row = {}
+        self._bulk_styles = {}
 
     def select_sheet(self, sheet_name: str):
         """Select a sheet by name."""
@@ -52,6 +210,7 @@ class ExcelHelper:
 
     def write_cell(self, row: int, col: int, value: Any):
         """Write a value to a specific cell."""
+        self._check_cell_access()
         self.active_sheet.cell(row=row, column=col, value=value)
 
     def read_cell(self, row: int, col: int) -> Any:
@@ -60,78 +219,208 @@ class ExcelHelper:
 
     def write_row(self, row: int, data: List[Any]):
         """Write a list of values to a row."""
-        for col, value in enumerate(data, start=1):
-            self.write_cell(row, col, value)
+        self.write_range(row, 1, [data])
 
     def read_row(self, row: int) -> List[Any]:
         """Read all values from a row."""
-        return [cell.value for cell in self.active_sheet[row]]
+        return list(
+            next(
+                self.active_sheet.iter_rows(min_row=row, max_row=row, values_only=True),
+                (),
+            )
+        )
 
     def write_column(self, col: int, data: List[Any]):
         """Write a list of values to a column."""
+        self._check_cell_access()
+        cell = self.active_sheet.cell
         for row, value in enumerate(data, start=1):
-            self.write_cell(row, col, value)
+            cell(row=row, column=col, value=value)
 
     def read_column(self, col: int) -> List[Any]:
         """Read all values from a column."""
-        return [cell.value for cell in self.active_sheet[get_column_letter(col)]]
+        return [
+            value
+            for (value,) in self.active_sheet.iter_rows(
+                min_col=col, max_col=col, values_only=True
+            )
+        ]
 
-    def write_range(self, start_row: int, start_col: int, data: List[List[Any]]):
+    def write_range(
+        self, start_row: int, start_col: int, data: Iterable[Iterable[Any]]
+    ):
         """Write a 2D list of values to a range of cells."""
-        for row_offset, row_data in enumerate(data):
-            for col_offset, value in enumerate(row_data):
-                self.write_cell(start_row + row_offset, start_col + col_offset, value)
+        if self.workbook.write_only:
+            self._append_rows(start_row, start_col, data)
+            return
+
+        self._check_cell_access()
+        ws = self.active_sheet
+        # Rows that start in column A directly below the last written row can
+        # be appended, which skips the per-cell coordinate lookups.
+        if start_col == 1 and start_row == ws._current_row + 1:
+            for row_data in data:
+                ws.append(_as_row(row_data))
+            return
+
+        cell = ws.cell
+        for row, row_data in enumerate(data, start=start_row):
+            for col, value in enumerate(row_data, start=start_col):
+                cell(row=row, column=col, value=value)
+
+    def _append_rows(
+        self, start_row: int, start_col: int, rows: Iterable[Iterable[Any]]
+    ):
+        """Stream rows to a write-only sheet, padding up to start_row and start_col."""
+        next_row = self._next_append_row.get(self.active_sheet.title, 1)
+        if start_row < next_row:
+            raise ValueError(
+                f"Row {start_row} has already been written in write-only mode."
+            )
+        for _ in range(start_row - next_row):
+            self.active_sheet.append([])
+        padding = [None] * (start_col - 1)
+        count = 0
+        for row_data in rows:
+            row_data = _as_row(row_data)
+            self.active_sheet.append(padding + list(row_data) if padding else row_data)
+            count += 1
+        self._next_append_row[self.active_sheet.title] = start_row + count
 
     def read_range(
-        self, start_row: int, start_col: int, end_row: int, end_col: int
-    ) -> List[List[Any]]:
-        """Read a range of cells and return a 2D list of values."""
-        return [
-            [cell.value for cell in row]
-            for row in self.active_sheet.iter_rows(
-                min_row=start_row, min_col=start_col, max_row=end_row, max_col=end_col
-            )
-        ]
+        self,
+        start_row: int,
+        start_col: int,
+        end_row: int,
+        end_col: int,
+        as_array: bool = False,
+        dtype: Any = None,
+    ) -> Union[List[List[Any]], np.ndarray]:
+        """
+        Read a range of cells and return a 2D list of values.
+
+        With as_array=True the values are returned as a NumPy array of the
+        given dtype (object by default). Empty cells become NaN for float
+        dtypes.
+        """
+        rows = self.active_sheet.iter_rows(
+            min_row=start_row,
+            min_col=start_col,
+            max_row=end_row,
+            max_col=end_col,
+            values_only=True,
+        )
+        if not as_array:
+            return [list(row) for row in rows]
+
+        data = np.empty(
+            (end_row - start_row + 1, end_col - start_col + 1),
+            dtype=object if dtype is None else dtype,
+        )
+        count = 0
+        for count, row in enumerate(rows, start=1):
+            data[count - 1, :] = row
+        # Read-only sheets stop at the last stored row, so rows past it are
+        # filled as empty cells instead of being left uninitialized.
+        data[count:] = None
+        return data
 
     def apply_style(self, row: int, col: int, style: Dict[str, Any]):
         """Apply a style to a specific cell."""
+        self._check_writable()
         cell = self.active_sheet.cell(row=row, column=col)
         for key, value in style.items():
             setattr(cell, key, value)
 
+    def bulk_apply_style(self, cell_range: str, style: Dict[str, Any]):
+        """
+        Apply the same style to every cell in a range such as "A1:C10".
+
+        The style is registered as a named style and shared by all cells in
+        the range, instead of being assigned attribute by attribute per cell.
+        Calls with the same style reuse the named style registered first.
+        Unlike apply_style, any existing styling of the cells is replaced.
+        """
+        self._check_cell_access()
+        key = tuple(sorted(style.items()))
+        named_style = self._bulk_styles.get(key)
+        if named_style is None:
+            named_style = NamedStyle(name=self._unique_style_name())
+            for attr, value in style.items():
+                setattr(named_style, attr, value)
+            self.workbook.add_named_style(named_style)
+            self._bulk_styles[key] = named_style
+
+        min_col, min_row, max_col, max_row = range_boundaries(cell_range)
+        for row in self.active_sheet.iter_rows(
+            min_row=min_row, min_col=min_col, max_row=max_row, max_col=max_col
+        ):
+            for cell in row:
+                cell.style = named_style
+
+    def _unique_style_name(self) -> str:
+        """Return a named style name not yet used in the workbook."""
+        existing = set(self.workbook.named_styles)
+        idx = len(existing)
+        while f"ExcelHelper Style {idx}" in existing:
+            idx += 1
+        return f"ExcelHelper Style {idx}"
+
     def auto_fit_columns(self):
         """Auto-fit all columns in the active sheet."""
-        for column in self.active_sheet.columns:
-            max_length = 0
-            column_letter = get_column_letter(column[0].column)
-            for cell in column:
-                with contextlib.suppress(Exception):
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(cell.value)
-            adjusted_width = max_length + 2
-            self.active_sheet.column_dimensions[column_letter].width = adjusted_width
+        self._check_writable()
+        ws = self.active_sheet
+        for col_idx, col_values in enumerate(ws.iter_cols(values_only=True), start=1):
+            max_length = max(
+                (len(str(value)) for value in col_values if value is not None),
+                default=0,
+            )
+            ws.column_dimensions[get_column_letter(col_idx)].width = max_length + 2
 
     def set_formula(self, row: int, col: int, formula: str):
         """Set a formula in a specific cell."""
+        self._check_cell_access()
         self.active_sheet.cell(row=row, column=col, value=formula)
 
-    def get_formula(self, row: int, col: int) -> str:
-        """Get the formula from a specific cell."""
-        return (
-            self.active_sheet.cell(row=row, column=col).data_type == "f"
-            and self.active_sheet.cell(row=row, column=col).value
-        )
+    def write_formulas(self, formulas: Iterable[Tuple[int, int, str]]):
+        """Set many formulas at once from (row, col, formula) tuples."""
+        self._check_cell_access()
+        cell = self.active_sheet.cell
+        for row, col, formula in formulas:
+            cell(row=row, column=col, value=formula)
+
+    def get_formula(self, row: int, col: int) -> Optional[str]:
+        """Get the formula from a specific cell, or None if it holds no formula."""
+        cell = self.active_sheet.cell(row=row, column=col)
+        return cell.value if cell.data_type == "f" else None
 
     def copy_formula(self, from_row: int, from_col: int, to_row: int, to_col: int):
         """Copy a formula from one cell to another, adjusting cell references."""
+        self._check_cell_access()
         source_cell = self.active_sheet.cell(row=from_row, column=from_col)
         target_cell = self.active_sheet.cell(row=to_row, column=to_col)
 
         if source_cell.data_type == "f":
-            translated_formula = Translator(
-                source_cell.value, origin=source_cell.coordinate
-            ).translate_formula(target_cell.coordinate)
-            target_cell.value = translated_formula
+            formula = source_cell.value
+            origin = source_cell.coordinate
+            target_cell.value = Translator(formula, origin=origin).translate_formula(
+                target_cell.coordinate
+            )
+
+    def copy_formula_range(
+        self, from_row: int, from_col: int, dest_cells: Iterable[Tuple[int, int]]
+    ):
+        """Copy a formula from one cell to many (row, col) cells, parsing it only once."""
+        self._check_cell_access()
+        source_cell = self.active_sheet.cell(row=from_row, column=from_col)
+        if source_cell.data_type != "f":
+            return
+
+        translator = Translator(source_cell.value, origin=source_cell.coordinate)
+        cell = self.active_sheet.cell
+        for row, col in dest_cells:
+            target_cell = cell(row=row, column=col)
+            target_cell.value = translator.translate_formula(target_cell.coordinate)
 
     def sum_range(
         self,
@@ -143,10 +432,8 @@ class ExcelHelper:
         result_col: int,
     ):
         """Sum a range of cells and put the result in another cell."""
-        start_cell = get_column_letter(start_col) + str(start_row)
-        end_cell = get_column_letter(end_col) + str(end_row)
-        formula = f"=SUM({start_cell}:{end_cell})"
-        self.set_formula(result_row, result_col, formula)
+        cell_range = _range_ref(start_row, start_col, end_row, end_col)
+        self.set_formula(result_row, result_col, f"=SUM({cell_range})")
 
     def average_range(
         self,
@@ -158,10 +445,8 @@ class ExcelHelper:
         result_col: int,
     ):
         """Calculate the average of a range of cells and put the result in another cell."""
-        start_cell = get_column_letter(start_col) + str(start_row)
-        end_cell = get_column_letter(end_col) + str(end_row)
-        formula = f"=AVERAGE({start_cell}:{end_cell})"
-        self.set_formula(result_row, result_col, formula)
+        cell_range = _range_ref(start_row, start_col, end_row, end_col)
+        self.set_formula(result_row, result_col, f"=AVERAGE({cell_range})")
 
     def count_range(
         self,
@@ -173,10 +458,8 @@ class ExcelHelper:
         result_col: int,
     ):
         """Count non-empty cells in a range and put the result in another cell."""
-        start_cell = get_column_letter(start_col) + str(start_row)
-        end_cell = get_column_letter(end_col) + str(end_row)
-        formula = f"=COUNT({start_cell}:{end_cell})"
-        self.set_formula(result_row, result_col, formula)
+        cell_range = _range_ref(start_row, start_col, end_row, end_col)
+        self.set_formula(result_row, result_col, f"=COUNT({cell_range})")
 
     def if_formula(
         self,
@@ -188,7 +471,7 @@ class ExcelHelper:
         result_col: int,
     ):
         """Set an IF formula in a specific cell."""
-        condition_cell = get_column_letter(condition_col) + str(condition_row)
+        condition_cell = _cell_ref(condition_row, condition_col)
         formula = f'=IF({condition_cell}, "{true_value}", "{false_value}")'
         self.set_formula(result_row, result_col, formula)
 
@@ -205,8 +488,10 @@ class ExcelHelper:
         result_col: int,
     ):
         """Set a VLOOKUP formula in a specific cell."""
-        lookup_value = get_column_letter(lookup_value_col) + str(lookup_value_row)
-        table_range = f"{get_column_letter(table_start_col)}{table_start_row}:{get_column_letter(table_end_col)}{table_end_row}"
+        lookup_value = _cell_ref(lookup_value_row, lookup_value_col)
+        table_range = _range_ref(
+            table_start_row, table_start_col, table_end_row, table_end_col
+        )
         formula = f"=VLOOKUP({lookup_value}, {table_range}, {col_index}, FALSE)"
         self.set_formula(result_row, result_col, formula)
 
@@ -253,15 +538,14 @@ class ExcelHelper:
         pivot_sheet: Worksheet = self.workbook.create_sheet("PivotTable")
         pivot_sheet.cell(row=1, column=1, value="Pivot Table")
 
-        # Create a PivotTable
-        pivot_table: Table = Table(
-            displayName="PivotTable",
-            ref=f"A1:{get_column_letter(len(source_data[0]))}{len(source_data)}",
-        )
-        pivot_sheet.add_table(pivot_table)
-
+        # The source data is appended below the title, starting at row 2.
         for row in source_data:
             pivot_sheet.append(row)
+        ref = _range_ref(2, 1, len(source_data) + 1, len(source_data[0]))
+
+        # Create a PivotTable
+        pivot_table: Table = Table(displayName="PivotTable", ref=ref)
+        pivot_sheet.add_table(pivot_table)
 
         pivot_fields: List[dict] = [
             {
@@ -277,7 +561,7 @@ class ExcelHelper:
 
         pivot_sheet.pivot_tables.add(
             "PivotTable1",
-            f"A1:{get_column_letter(len(source_data[0]))}{len(source_data)}",
+            ref,
             pivot_location,
             pivot_fields,
         )
@@ -343,42 +627,120 @@ class ExcelHelper:
             raise OSError("This method can only be run on Windows.")
 
         try:
-            import win32com.client
-
-            excel: Any = win32com.client.Dispatch("Excel.Application")
+            excel = self._get_excel_application()
             wb: Any = excel.Workbooks.Open(self.filename)
-            excel.Application.Run(macro_name)
-            wb.Save()
+            try:
+                screen_updating = excel.ScreenUpdating
+                enable_events = excel.EnableEvents
+                excel.ScreenUpdating = False
+                excel.EnableEvents = False
+                try:
+                    excel.Run(macro_name)
+                finally:
+                    excel.ScreenUpdating = screen_updating
+                    excel.EnableEvents = enable_events
+                wb.Save()
+            finally:
+                wb.Close(SaveChanges=False)
         except Exception as e:
+            self._quit_excel_application()
             # sourcery skip: raise-specific-error
             raise Exception(f"Error running macro: {str(e)}") from e
-        finally:
-            if "excel" in locals():
-                excel.Application.Quit()
+
+    def _get_excel_application(self) -> Any:
+        """
+        Return the Excel application used by run_macro, starting it on first use.
+
+        EnsureDispatch generates early-bound wrappers from Excel's type library,
+        so method calls skip the per-call name lookups of late binding.
+        """
+        if self._excel is None:
+            from win32com.client.gencache import EnsureDispatch
+
+            self._excel = EnsureDispatch("Excel.Application")
+            # Quit Excel even if the helper is dropped without close_workbook.
+            self._excel_finalizer = weakref.finalize(self, _quit_excel, self._excel)
+        return self._excel
+
+    def _quit_excel_application(self):
+        """Quit the Excel application started by run_macro, if any."""
+        if self._excel_finalizer is not None:
+            self._excel_finalizer()
+        self._excel = None
+        self._excel_finalizer = None
 
     def _is_windows(self) -> bool:
         """Check if the current operating system is Windows."""
-        import platform
-
-        return platform.system().lower() == "windows"
+        return _IS_WINDOWS
 
     def to_dataframe(
         self,
         sheet_name: Union[str, None] = None,
         start_row: int = 1,
         start_col: int = 1,
+        dtype: Optional[str] = None,
     ):
-        """Convert Excel data to a Pandas DataFrame."""
+        """
+        Convert Excel data to a Pandas DataFrame.
+
+        If dtype is given (e.g. "float64"), the values below the header are
+        converted straight into a NumPy array of that dtype, skipping pandas'
+        per-column type inference. Empty cells become NaN for float dtypes.
+        """
+        if sheet_name:
+            self.select_sheet(sheet_name)
+
+        rows = self.active_sheet.iter_rows(
+            min_row=start_row, min_col=start_col, values_only=True
+        )
+        header = next(rows, ())
+        if dtype is None:
+            return pd.DataFrame(list(rows), columns=header)
+
+        data = np.array(list(rows), dtype=dtype)
+        if data.size == 0:
+            data = data.reshape(0, len(header))
+        return pd.DataFrame(data, columns=header, copy=False)
+
+    def iter_dataframes(
+        self,
+        chunk_rows: int = 10_000,
+        sheet_name: Optional[str] = None,
+        start_row: int = 1,
+        start_col: int = 1,
+    ) -> Iterable[pd.DataFrame]:
+        """
+        Yield the Excel data as Pandas DataFrames of at most chunk_rows rows.
+
+        The first row is used as the header of every chunk. Only one chunk is
+        held in memory at a time, which combined with mode="r" keeps memory
+        bounded for sheets too large to load at once. A sheet with only a
+        header row yields a single empty DataFrame with those columns.
+        """
+        if chunk_rows < 1:
+            raise ValueError("chunk_rows must be at least 1.")
+
         if sheet_name:
             self.select_sheet(sheet_name)
 
-        data = self.read_range(
-            start_row,
-            start_col,
-            self.active_sheet.max_row,
-            self.active_sheet.max_column,
+        rows = self.active_sheet.iter_rows(
+            min_row=start_row, min_col=start_col, values_only=True
         )
-        return pd.DataFrame(data[1:], columns=data[0])
+        return self._iter_dataframe_chunks(rows, chunk_rows)
+
+    @staticmethod
+    def _iter_dataframe_chunks(
+        rows: Iterator[Tuple[Any, ...]], chunk_rows: int
+    ) -> Iterator[pd.DataFrame]:
+        """Yield DataFrames of chunk_rows rows, using the first row as header."""
+        header = next(rows, ())
+        chunk = list(itertools.islice(rows, chunk_rows))
+        if not chunk:
+            yield pd.DataFrame(columns=header)
+            return
+        while chunk:
+            yield pd.DataFrame(chunk, columns=header)
+            chunk = list(itertools.islice(rows, chunk_rows))
 
     def from_dataframe(
         self,
@@ -397,7 +759,7 @@ class ExcelHelper:
             self.select_sheet(sheet_name)
 
         self.write_range(
-            start_row, start_col, [df.columns.tolist()] + df.values.tolist()
+            start_row, start_col, dataframe_to_rows(df, index=False, header=True)
         )
 
     def use_template(
@@ -427,9 +789,14 @@ class ExcelHelper:
             wb: Workbook = openpyxl.load_workbook(template_file)
             ws: Worksheet = wb.active
 
+            # Identical placeholder strings are compiled once per call.
+            templates: Dict[str, Template] = {}
             for cell in ws._cells.values():
-                if cell.data_type == "s" and "{{" in cell.value and "}}" in cell.value:
-                    template = Template(cell.value)
+                value = cell.value
+                if cell.data_type == "s" and _PLACEHOLDER_RE.search(value):
+                    template = templates.get(value)
+                    if template is None:
+                        template = templates[value] = _TEMPLATE_ENV.from_string(value)
                     cell.value = template.render(context)
 
             wb.save(output_file)
@@ -27,8 +27,12 @@ setup(
     ],
     python_requires=">=3.6",
     install_requires=[
+        "numpy>=1.22.4",
         "openpyxl>=3.0.0",
         "pandas>=2.2.2",
         "Jinja2>=3.1.4",
     ],
+    extras_require={
+        "fast": ["lxml>=4.9"],
+    },
 )
@@ -1,8 +1,14 @@
 import os
+import sys
+import types
 
+import numpy as np
+import pandas as pd
 import pytest
+from openpyxl.styles import Font
 
 from excel_helper import ExcelHelper
+from excel_helper import excel_helper as excel_helper_module
 
 
 @pytest.fixture
@@ -102,3 +108,313 @@ def test_auto_fit_columns(excel_helper: ExcelHelper):
         excel_helper.active_sheet.column_dimensions["A"].width
         < excel_helper.active_sheet.column_dimensions["B"].width
     )
+
+
+def test_read_only_mode(excel_helper: ExcelHelper, excel_file):
+    test_data = [["Name", "Value"], ["A", 1], ["B", 2]]
+    excel_helper.write_range(1, 1, test_data)
+    excel_helper.save_workbook()
+
+    reader = ExcelHelper(excel_file, mode="r")
+    reader.open_workbook()
+    try:
+        assert reader.read_range(1, 1, 3, 2) == test_data
+        assert reader.read_row(2) == ["A", 1]
+        assert reader.read_column(2) == ["Value", 1, 2]
+        df = reader.to_dataframe()
+        assert df.columns.tolist() == ["Name", "Value"]
+        assert df["Value"].tolist() == [1, 2]
+        with pytest.raises(ValueError):
+            reader.write_cell(1, 1, "X")
+    finally:
+        reader.close_workbook()
+
+
+def test_write_only_from_dataframe(excel_file, monkeypatch):
+    monkeypatch.setattr(excel_helper_module, "_HAS_LXML", True)
+    writer = ExcelHelper(excel_file, mode="w")
+    writer.create_new_workbook(write_only=True)
+    writer.from_dataframe(pd.DataFrame({"Name": ["A", "B"], "Value": [1, 2]}))
+    writer.write_range(5, 2, [["x", "y"]])
+    with pytest.raises(ValueError):
+        writer.write_range(1, 1, [["z"]])
+    writer.save_workbook()
+
+    reader = ExcelHelper(excel_file)
+    reader.open_workbook()
+    assert reader.read_range(1, 1, 3, 2) == [["Name", "Value"], ["A", 1], ["B", 2]]
+    assert reader.read_row(5) == [None, "x", "y"]
+
+
+def test_write_range_appends_and_overwrites(excel_helper: ExcelHelper):
+    excel_helper.write_range(1, 1, [["A", "B"], ["C", "D"]])
+    excel_helper.write_row(3, ["E", "F"])
+    excel_helper.write_range(2, 2, [["X"]])
+    assert excel_helper.read_range(1, 1, 3, 2) == [["A", "B"], ["C", "X"], ["E", "F"]]
+
+
+def test_get_formula_without_formula(excel_helper: ExcelHelper):
+    excel_helper.write_cell(1, 1, "Plain")
+    assert excel_helper.get_formula(1, 1) is None
+
+
+def test_copy_formula(excel_helper: ExcelHelper):
+    excel_helper.set_formula(1, 3, "=A1+B1")
+    excel_helper.copy_formula(1, 3, 2, 3)
+    assert excel_helper.get_formula(2, 3) == "=A2+B2"
+
+
+def test_auto_fit_columns_numeric(excel_helper: ExcelHelper):
+    excel_helper.write_range(1, 1, [[1, 1234567890]])
+    excel_helper.auto_fit_columns()
+    assert excel_helper.active_sheet.column_dimensions["A"].width == 3
+    assert excel_helper.active_sheet.column_dimensions["B"].width == 12
+
+
+def test_use_template(excel_helper: ExcelHelper, excel_file, tmp_path):
+    excel_helper.write_range(
+        1, 1, [["Hello {{ name }}", "Hello {{ name }}"], ["Static", 42]]
+    )
+    excel_helper.save_workbook()
+    output_file = str(tmp_path / "report.xlsx")
+
+    excel_helper.use_template(excel_file, output_file, {"name": "World"})
+
+    report = ExcelHelper(output_file)
+    report.open_workbook()
+    assert report.read_range(1, 1, 2, 2) == [
+        ["Hello World", "Hello World"],
+        ["Static", 42],
+    ]
+
+
+def test_from_dataframe_offset(excel_helper: ExcelHelper):
+    df = pd.DataFrame({"Name": ["A", "B"], "Value": [1, 2]})
+    excel_helper.from_dataframe(df, start_row=2, start_col=2)
+    assert excel_helper.read_range(2, 2, 4, 3) == [
+        ["Name", "Value"],
+        ["A", 1],
+        ["B", 2],
+    ]
+    assert excel_helper.read_cell(1, 1) is None
+
+
+def test_to_dataframe_float_dtype(excel_helper: ExcelHelper):
+    excel_helper.write_range(1, 1, [["x", "y"], [1, 2.5], [3, None]])
+    df = excel_helper.to_dataframe(dtype="float64")
+    assert df.dtypes.tolist() == [np.float64, np.float64]
+    assert df["x"].tolist() == [1.0, 3.0]
+    assert np.isnan(df["y"].iloc[1])
+
+
+def test_write_formulas(excel_helper: ExcelHelper):
+    excel_helper.write_formulas([(1, 2, "=A1*2"), (2, 2, "=A2*2")])
+    assert excel_helper.get_formula(1, 2) == "=A1*2"
+    assert excel_helper.get_formula(2, 2) == "=A2*2"
+
+
+def test_copy_formula_range(excel_helper: ExcelHelper):
+    excel_helper.set_formula(1, 3, "=A1+B1")
+    excel_helper.copy_formula_range(1, 3, [(2, 3), (3, 3), (3, 4)])
+    assert excel_helper.get_formula(2, 3) == "=A2+B2"
+    assert excel_helper.get_formula(3, 3) == "=A3+B3"
+    assert excel_helper.get_formula(3, 4) == "=B3+C3"
+
+
+def test_write_only_warns_without_lxml(excel_file, monkeypatch):
+    monkeypatch.setattr(excel_helper_module, "_HAS_LXML", False)
+    with pytest.warns(UserWarning, match="lxml"):
+        ExcelHelper(excel_file, mode="w").create_new_workbook(write_only=True)
+
+
+def test_save_workbook_replaces_file(tmp_path):
+    filename = str(tmp_path / "saved.xlsx")
+    helper = ExcelHelper(filename)
+    helper.create_new_workbook()
+    helper.write_cell(1, 1, "First")
+    helper.save_workbook()
+    helper.write_cell(1, 1, "Second")
+    helper.save_workbook()
+
+    assert os.listdir(tmp_path) == ["saved.xlsx"]
+    reader = ExcelHelper(filename)
+    reader.open_workbook()
+    assert reader.read_cell(1, 1) == "Second"
+
+
+def test_read_range_as_array(excel_helper: ExcelHelper):
+    excel_helper.write_range(1, 1, [[1, 2], [3, None]])
+    data = excel_helper.read_range(1, 1, 2, 2, as_array=True, dtype=float)
+    assert data.dtype == np.float64
+    assert data.shape == (2, 2)
+    assert data[0].tolist() == [1.0, 2.0]
+    assert np.isnan(data[1, 1])
+
+
+def test_use_template_ignores_unbalanced_braces(
+    excel_helper: ExcelHelper, excel_file, tmp_path
+):
+    excel_helper.write_range(1, 1, [["}} not a {{ template", "{{ name }}"]])
+    excel_helper.save_workbook()
+    output_file = str(tmp_path / "report.xlsx")
+
+    excel_helper.use_template(excel_file, output_file, {"name": "World"})
+
+    report = ExcelHelper(output_file)
+    report.open_workbook()
+    assert report.read_row(1) == ["}} not a {{ template", "World"]
+
+
+def test_bulk_apply_style(excel_helper: ExcelHelper):
+    bold = Font(bold=True)
+    excel_helper.bulk_apply_style("A1:B2", {"font": bold, "number_format": "0.00"})
+    excel_helper.bulk_apply_style("C1", {"font": bold})
+    for row in excel_helper.active_sheet.iter_rows(min_row=1, max_row=2, max_col=2):
+        for cell in row:
+            assert cell.font.bold
+            assert cell.number_format == "0.00"
+    assert excel_helper.active_sheet["C1"].font.bold
+    assert excel_helper.active_sheet["C1"].number_format == "General"
+
+
+def test_iter_dataframes(excel_helper: ExcelHelper):
+    excel_helper.write_range(1, 1, [["x"]] + [[i] for i in range(5)])
+    chunks = list(excel_helper.iter_dataframes(chunk_rows=2))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert all(chunk.columns.tolist() == ["x"] for chunk in chunks)
+    assert pd.concat(chunks)["x"].tolist() == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlinks not supported")
+def test_save_workbook_through_symlink(tmp_path):
+    target = tmp_path / "target.xlsx"
+    link = tmp_path / "link.xlsx"
+    helper = ExcelHelper(str(target))
+    helper.create_new_workbook()
+    helper.save_workbook()
+    link.symlink_to(target)
+
+    helper = ExcelHelper(str(link))
+    helper.create_new_workbook()
+    helper.write_cell(1, 1, "Linked")
+    helper.save_workbook()
+
+    assert link.is_symlink()
+    reader = ExcelHelper(str(target))
+    reader.open_workbook()
+    assert reader.read_cell(1, 1) == "Linked"
+
+
+def test_bulk_apply_style_reuses_named_style(excel_helper: ExcelHelper):
+    styles_before = len(excel_helper.workbook.named_styles)
+    excel_helper.bulk_apply_style("A1:B1", {"font": Font(bold=True)})
+    excel_helper.bulk_apply_style("A2:B2", {"font": Font(bold=True)})
+    assert len(excel_helper.workbook.named_styles) == styles_before + 1
+    assert excel_helper.active_sheet["B2"].font.bold
+
+
+class FakeExcel:
+    def __init__(self):
+        self.ScreenUpdating = True
+        self.EnableEvents = True
+        self.Workbooks = self
+        self.calls = []
+
+    def Open(self, filename):
+        self.calls.append(("Open", self.EnableEvents))
+        return self
+
+    def Run(self, macro_name):
+        self.calls.append(("Run", self.EnableEvents))
+
+    def Save(self):
+        self.calls.append(("Save", self.EnableEvents))
+
+    def Close(self, SaveChanges):
+        self.calls.append(("Close", self.EnableEvents))
+
+    def Quit(self):
+        self.calls.append(("Quit", self.EnableEvents))
+
+
+def test_run_macro_reuses_and_quits_excel(excel_file, monkeypatch):
+    excel = FakeExcel()
+    gencache = types.ModuleType("win32com.client.gencache")
+    gencache.EnsureDispatch = lambda name: excel
+    monkeypatch.setitem(sys.modules, "win32com", types.ModuleType("win32com"))
+    monkeypatch.setitem(
+        sys.modules, "win32com.client", types.ModuleType("win32com.client")
+    )
+    monkeypatch.setitem(sys.modules, "win32com.client.gencache", gencache)
+    monkeypatch.setattr(excel_helper_module, "_IS_WINDOWS", True)
+
+    with ExcelHelper(excel_file) as helper:
+        helper.run_macro("First")
+        helper.run_macro("Second")
+        assert ("Quit", True) not in excel.calls
+
+    assert excel.calls.count(("Open", True)) == 2
+    assert excel.calls.count(("Run", False)) == 2
+    assert excel.calls[-1] == ("Quit", True)
+    assert excel.calls.count(("Quit", True)) == 1
+
+
+def test_iter_dataframes_validates_eagerly(excel_helper: ExcelHelper):
+    with pytest.raises(ValueError):
+        excel_helper.iter_dataframes(chunk_rows=0)
+    with pytest.raises(ValueError):
+        excel_helper.iter_dataframes(sheet_name="Missing")
+
+
+def test_iter_dataframes_header_only(excel_helper: ExcelHelper):
+    excel_helper.write_row(1, ["x", "y"])
+    chunks = list(excel_helper.iter_dataframes())
+    assert len(chunks) == 1
+    assert chunks[0].empty
+    assert chunks[0].columns.tolist() == ["x", "y"]
+
+
+@pytest.mark.parametrize("write_only", [False, True])
+def test_write_range_numpy_rows(excel_file, monkeypatch, write_only):
+    monkeypatch.setattr(excel_helper_module, "_HAS_LXML", True)
+    writer = ExcelHelper(excel_file)
+    writer.create_new_workbook(write_only=write_only)
+    writer.write_range(1, 1, np.array([[1, 2], [3, 4]]))
+    writer.save_workbook()
+
+    reader = ExcelHelper(excel_file)
+    reader.open_workbook()
+    assert reader.read_range(1, 1, 2, 2) == [[1, 2], [3, 4]]
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permissions only")
+def test_save_workbook_permissions(tmp_path):
+    filename = str(tmp_path / "saved.xlsx")
+    umask = os.umask(0o022)
+    try:
+        helper = ExcelHelper(filename)
+        helper.create_new_workbook()
+        helper.save_workbook()
+        assert os.stat(filename).st_mode & 0o777 == 0o644
+
+        os.chmod(filename, 0o600)
+        helper.save_workbook()
+        assert os.stat(filename).st_mode & 0o777 == 0o600
+    finally:
+        os.umask(umask)
+
+
+def test_read_range_as_array_past_last_row(excel_helper: ExcelHelper, excel_file):
+    excel_helper.write_range(1, 1, [["x", "y"], [1, 2], [3, 4]])
+    excel_helper.save_workbook()
+
+    reader = ExcelHelper(excel_file, mode="r")
+    reader.open_workbook()
+    try:
+        data = reader.read_range(2, 1, 7, 2, as_array=True, dtype=float)
+        objects = reader.read_range(2, 1, 5, 2, as_array=True)
+    finally:
+        reader.close_workbook()
+    assert data[:2].tolist() == [[1.0, 2.0], [3.0, 4.0]]
+    assert np.isnan(data[2:]).all()
+    assert objects[2:].tolist() == [[None, None], [None, None]]